@@ -1,18 +1,34 @@
 """Planet Simulator"""
 
+import functools
 import math
+from dataclasses import dataclass
 
 import pygame
 from pygame.locals import KEYDOWN, MOUSEMOTION, MOUSEWHEEL, RESIZABLE, VIDEORESIZE
 
+try:
+    import numpy as np
+except ImportError:  # Fall back to the pure-Python physics path
+    np = None
+
+try:
+    import numba
+except ImportError:  # Fall back to the broadcasted NumPy step
+    numba = None
+
 WORLD_SCALE = 10_000_000  # 1 pixel = 10_000_000 meters = 10_000 km
 WINDOW_SIZE = (800, 600)
 CURRENT_POSITION = [
     WINDOW_SIZE[0] * WORLD_SCALE / 20000,
     WINDOW_SIZE[1] * WORLD_SCALE / 20000,
 ]  # Center (0, 0)
+if np is not None:
+    # Hold the camera offset as a float64 2-vector; it is only ever updated
+    # item-wise, never rebuilt as a fresh list
+    CURRENT_POSITION = np.array(CURRENT_POSITION)
 CURRENT_ZOOM = 0.001  # Start with a zoom level that makes both planets visible
-FIXED_TIMESTEP = 60 * 60  # 1 hour per update (higher = less accurate but faster)
+FIXED_TIMESTEP = 60 * 60 * 6  # 6 hours per update (higher = less accurate but faster)
 FPS = 60
 GUI_UPDATE_RATE = FPS * 0.2  # Update the GUI every 0.2 seconds
 
@@ -24,9 +40,32 @@ GRAY = (70, 70, 70)
 # Constants
 _G = 6.67430e-11  # Gravitational constant
 
+# Barnes-Hut settings: above this body count the O(N^2) pairwise kernel loses
+# to the O(N log N) quadtree, which approximates far-away clusters by their
+# center of mass whenever node_size / distance < _BH_THETA
+_BH_THRESHOLD = 64
+_BH_THETA = 0.5
+_BH_MAX_DEPTH = 48
+
 
 class Planet:
     """Class representing a planet/star."""
+
+    # No per-instance __dict__: attribute access becomes an offset load,
+    # which matters with .position/.velocity/.mass read in the hot loops
+    __slots__ = (
+        "name",
+        "mass",
+        "radius",
+        "position",
+        "velocity",
+        "color",
+        "acceleration",
+        "_name_surface",
+        "_info_surfaces",
+        "_sprite_cache",
+    )
+
     def __init__(
         self,
         name: str,
@@ -42,63 +81,358 @@ class Planet:
         self.position = position  # In world coordinates (scaled)
         self.velocity = velocity  # In meters per second
         self.color = color
-
-    def draw(self, screen: pygame.surface.Surface) -> None:
-        """Draw the planet on the screen."""
-        x, y = world_to_screen(self.position[0], self.position[1])
-        if x is not None:
-            pygame.draw.circle(
-                screen,
-                self.color,
-                (x, y),
-                max(size_to_screen(self.radius), 2),
+        self.acceleration = None  # Cached by step_planets between leapfrog steps
+        self._name_surface = None  # Rendered once on first use, never changes
+        self._info_surfaces = None  # Pos/vel text, refreshed at GUI_UPDATE_RATE
+        self._sprite_cache = {}  # Circle sprites keyed by on-screen radius
+
+    def ensure_label(self, font: pygame.font.Font) -> pygame.surface.Surface:
+        """Lazily render and cache the name label."""
+        if self._name_surface is None:
+            self._name_surface = font.render(f"Name: {self.name}", True, WHITE)
+        return self._name_surface
+
+    def draw(
+        self,
+        screen: pygame.surface.Surface,
+        screen_pos: tuple[float, float],
+    ) -> None:
+        """Draw the planet at its cached screen position.
+
+        Small circles are rasterized once per integer on-screen radius and
+        cached; blitting the sprite is much cheaper than re-running
+        pygame.draw.circle every frame. Large circles (zoomed-in suns) are
+        drawn directly: their SRCALPHA sprites would be tens of MB each and
+        a zoom crosses a new radius almost every frame anyway.
+        """
+        radius = max(int(size_to_screen(self.radius)), 2)
+        if radius > 128:
+            pygame.draw.circle(screen, self.color, screen_pos, radius)
+            return
+        sprite = self._sprite_cache.get(radius)
+        if sprite is None:
+            if len(self._sprite_cache) > 32:  # Bound memory while zooming
+                self._sprite_cache.clear()
+            size = 2 * radius + 2
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, self.color, (radius + 1, radius + 1), radius)
+            self._sprite_cache[radius] = sprite
+        screen.blit(sprite, (screen_pos[0] - radius - 1, screen_pos[1] - radius - 1))
+
+
+def _accel_kernel(pos, mass, scale, acc):
+    """Pairwise gravitational acceleration kernel over the world arrays.
+
+    Written as explicit loops so Numba can compile it without the N*N*2
+    temporaries the broadcasted NumPy version allocates.
+    """
+    n = pos.shape[0]
+    for i in range(n):
+        acc_x = 0.0
+        acc_y = 0.0
+        for j in range(n):
+            if i == j:
+                continue
+            dx = (pos[j, 0] - pos[i, 0]) * scale
+            dy = (pos[j, 1] - pos[i, 1]) * scale
+            r2 = dx * dx + dy * dy
+            if r2 == 0.0:  # Coincident bodies exert no force
+                continue
+            inv_r3 = r2**-1.5
+            acc_x += mass[j] * dx * inv_r3
+            acc_y += mass[j] * dy * inv_r3
+        acc[i, 0] = _G * acc_x
+        acc[i, 1] = _G * acc_y
+
+
+def _bh_build(pos, mass, children, center, half, node_com, node_mass, node_body):
+    """Build a flat-array quadtree over the body positions.
+
+    Nodes live in parallel arrays instead of a Python object tree so the
+    build and traversal stay compilable and cache-friendly: `children[k]`
+    holds the four child indices (-1 = none), `node_com`/`node_mass` the
+    mass-weighted center, `center`/`half` the node square, and `node_body`
+    the body index for single-body leaves (-1 otherwise, -2 for bodies
+    merged at the depth cap). Returns the node count, or -1 if the arrays
+    are too small.
+    """
+    n = pos.shape[0]
+    capacity = children.shape[0]
+
+    # Root square covering all bodies
+    min_x = max_x = pos[0, 0]
+    min_y = max_y = pos[0, 1]
+    for i in range(1, n):
+        min_x = min(min_x, pos[i, 0])
+        max_x = max(max_x, pos[i, 0])
+        min_y = min(min_y, pos[i, 1])
+        max_y = max(max_y, pos[i, 1])
+    root_half = 0.5 * max(max_x - min_x, max_y - min_y)
+    root_half = root_half * 1.001 + 1e-9  # Keep boundary bodies inside
+
+    children[0, :] = -1
+    center[0, 0] = 0.5 * (min_x + max_x)
+    center[0, 1] = 0.5 * (min_y + max_y)
+    half[0] = root_half
+    node_com[0, :] = 0.0
+    node_mass[0] = 0.0
+    node_body[0] = -1
+    node_count = 1
+
+    for body in range(n):
+        node = 0
+        depth = 0
+        while True:
+            if depth >= _BH_MAX_DEPTH:
+                # Coincident/ultra-close bodies: merge into this node
+                node_mass[node] += mass[body]
+                node_com[node, 0] += mass[body] * pos[body, 0]
+                node_com[node, 1] += mass[body] * pos[body, 1]
+                if node_body[node] >= 0:
+                    node_body[node] = -2
+                break
+            if node_body[node] == -1 and children[node, 0] == -1 and node_mass[node] == 0.0:
+                # Empty leaf: claim it
+                node_body[node] = body
+                node_mass[node] = mass[body]
+                node_com[node, 0] = mass[body] * pos[body, 0]
+                node_com[node, 1] = mass[body] * pos[body, 1]
+                break
+            if node_body[node] >= 0:
+                # Occupied leaf: push the resident body into a child
+                old = node_body[node]
+                node_body[node] = -1
+                quadrant = (1 if pos[old, 1] >= center[node, 1] else 0) * 2 + (
+                    1 if pos[old, 0] >= center[node, 0] else 0
+                )
+                if node_count >= capacity:
+                    return -1
+                child = node_count
+                node_count += 1
+                children[child, :] = -1
+                quarter = 0.5 * half[node]
+                center[child, 0] = center[node, 0] + (
+                    quarter if quadrant % 2 else -quarter
+                )
+                center[child, 1] = center[node, 1] + (
+                    quarter if quadrant >= 2 else -quarter
+                )
+                half[child] = quarter
+                node_body[child] = old
+                node_mass[child] = mass[old]
+                node_com[child, 0] = mass[old] * pos[old, 0]
+                node_com[child, 1] = mass[old] * pos[old, 1]
+                children[node, quadrant] = child
+            # Internal node: accumulate this body and descend
+            node_mass[node] += mass[body]
+            node_com[node, 0] += mass[body] * pos[body, 0]
+            node_com[node, 1] += mass[body] * pos[body, 1]
+            quadrant = (1 if pos[body, 1] >= center[node, 1] else 0) * 2 + (
+                1 if pos[body, 0] >= center[node, 0] else 0
             )
-
-    def update(self, planet_list: list["Planet"], timestep: float) -> None:
-        """Update the position and velocity of the planet."""
-        total_force_x, total_force_y = 0, 0
-
-        for planet in planet_list:
-            if planet == self:
+            child = children[node, quadrant]
+            if child == -1:
+                if node_count >= capacity:
+                    return -1
+                child = node_count
+                node_count += 1
+                children[child, :] = -1
+                quarter = 0.5 * half[node]
+                center[child, 0] = center[node, 0] + (
+                    quarter if quadrant % 2 else -quarter
+                )
+                center[child, 1] = center[node, 1] + (
+                    quarter if quadrant >= 2 else -quarter
+                )
+                half[child] = quarter
+                node_com[child, :] = 0.0
+                node_mass[child] = 0.0
+                node_body[child] = -1
+                children[node, quadrant] = child
+            node = child
+            depth += 1
+
+    # Turn mass-weighted sums into actual centers of mass
+    for k in range(node_count):
+        if node_mass[k] > 0.0:
+            node_com[k, 0] /= node_mass[k]
+            node_com[k, 1] /= node_mass[k]
+    return node_count
+
+
+def _bh_accel(
+    pos, children, half, node_com, node_mass, node_body, node_count, theta, scale, acc
+):
+    """Barnes-Hut acceleration: walk the quadtree once per body.
+
+    Nodes whose square looks small from the body (size/distance < theta)
+    contribute as a single point mass at their center of mass; otherwise
+    their children are pushed onto an explicit stack and visited.
+    """
+    n = pos.shape[0]
+    theta2 = theta * theta
+    stack = np.empty(node_count, dtype=np.int64)
+    for i in range(n):
+        acc_x = 0.0
+        acc_y = 0.0
+        stack[0] = 0
+        top = 1
+        while top > 0:
+            top -= 1
+            node = stack[top]
+            if node_mass[node] == 0.0:
                 continue
-
-            force_x, force_y = calculate_gravity(self, planet)
-            total_force_x += force_x
-            total_force_y += force_y
-
-        # Update velocity based on total gravitational forces
-        self.velocity[0] += (total_force_x / self.mass) * timestep
-        self.velocity[1] += (total_force_y / self.mass) * timestep
-
-        # Update position based on velocity
-        self.position[0] += self.velocity[0] * timestep / WORLD_SCALE
-        self.position[1] += self.velocity[1] * timestep / WORLD_SCALE
-
-
-def world_to_screen(
-    world_x: float, world_y: float, allow_offscreen: bool = False
-) -> tuple[float, float]:
-    """Convert world coordinates to screen coordinates."""
-    position = [
-        (world_x + CURRENT_POSITION[0]) * CURRENT_ZOOM,
-        (world_y + CURRENT_POSITION[1]) * CURRENT_ZOOM,
-    ]
-    if not allow_offscreen and (
-        position[0] < 0
-        or position[1] < 0
-        or position[0] > WINDOW_SIZE[0]
-        or position[1] > WINDOW_SIZE[1]
-    ):
-        return None, None
-    return position
+            dx = (node_com[node, 0] - pos[i, 0]) * scale
+            dy = (node_com[node, 1] - pos[i, 1]) * scale
+            r2 = dx * dx + dy * dy
+            if children[node, 0] == -1 and children[node, 1] == -1 and (
+                children[node, 2] == -1 and children[node, 3] == -1
+            ):
+                if node_body[node] == i or r2 == 0.0:
+                    continue
+                inv_r3 = r2**-1.5
+                acc_x += node_mass[node] * dx * inv_r3
+                acc_y += node_mass[node] * dy * inv_r3
+            else:
+                size = 2.0 * half[node] * scale
+                if size * size < theta2 * r2:
+                    inv_r3 = r2**-1.5
+                    acc_x += node_mass[node] * dx * inv_r3
+                    acc_y += node_mass[node] * dy * inv_r3
+                else:
+                    for quadrant in range(4):
+                        child = children[node, quadrant]
+                        if child != -1:
+                            stack[top] = child
+                            top += 1
+        acc[i, 0] = _G * acc_x
+        acc[i, 1] = _G * acc_y
+
+
+if numba is not None:
+    # cache=True writes the compiled kernels to disk so the JIT cost is
+    # only paid on the very first run
+    _accel_kernel = numba.njit(cache=True, fastmath=True, boundscheck=False)(
+        _accel_kernel
+    )
+    _bh_build = numba.njit(cache=True, boundscheck=False)(_bh_build)
+    _bh_accel = numba.njit(cache=True, fastmath=True, boundscheck=False)(_bh_accel)
+
+
+@dataclass
+class World:
+    """Structure-of-arrays state for the whole simulation.
+
+    Positions, velocities and masses live in parallel NumPy arrays so a
+    physics step is a handful of broadcasted array operations instead of an
+    O(N^2) pure-Python loop. Each planet's `position`/`velocity` are views
+    into the rows of `pos`/`vel`, so the rendering code keeps working on the
+    planet objects directly.
+    """
+
+    planets: list[Planet]
+    pos: "np.ndarray"  # (N, 2) in world coordinates (scaled)
+    vel: "np.ndarray"  # (N, 2) in meters per second
+    mass: "np.ndarray"  # (N,) in kilograms
+    acc: "np.ndarray"  # (N, 2) in meters per second squared
+
+    @classmethod
+    def from_planets(cls, planets: list[Planet]) -> "World":
+        """Build the arrays from a list of planets and rebind their state."""
+        pos = np.array([planet.position for planet in planets], dtype=np.float64)
+        vel = np.array([planet.velocity for planet in planets], dtype=np.float64)
+        mass = np.array([planet.mass for planet in planets], dtype=np.float64)
+        for i, planet in enumerate(planets):
+            planet.position = pos[i]
+            planet.velocity = vel[i]
+        world = cls(planets, pos, vel, mass, np.zeros_like(pos))
+        world.acc = world._accelerations()
+        return world
+
+    def _bh_accelerations(self) -> "np.ndarray":
+        """Compute accelerations through the Barnes-Hut quadtree."""
+        count = len(self.planets)
+        capacity = 16 * count + 64
+        while True:
+            children = np.empty((capacity, 4), dtype=np.int64)
+            center = np.empty((capacity, 2), dtype=np.float64)
+            half = np.empty(capacity, dtype=np.float64)
+            node_com = np.empty((capacity, 2), dtype=np.float64)
+            node_mass = np.empty(capacity, dtype=np.float64)
+            node_body = np.empty(capacity, dtype=np.int64)
+            node_count = _bh_build(
+                self.pos, self.mass, children, center, half, node_com, node_mass, node_body
+            )
+            if node_count != -1:
+                break
+            capacity *= 2  # Deep trees from tight clusters; retry bigger
+        acc = np.empty_like(self.pos)
+        _bh_accel(
+            self.pos,
+            children,
+            half,
+            node_com,
+            node_mass,
+            node_body,
+            node_count,
+            _BH_THETA,
+            WORLD_SCALE,
+            acc,
+        )
+        return acc
+
+    def _accelerations(self) -> "np.ndarray":
+        """Compute the gravitational acceleration on every planet."""
+        if len(self.planets) > _BH_THRESHOLD:
+            return self._bh_accelerations()
+        if numba is not None:
+            acc = np.empty_like(self.pos)
+            _accel_kernel(self.pos, self.mass, WORLD_SCALE, acc)
+            return acc
+        # d[i, j] is the vector from planet i to planet j, in meters
+        d = (self.pos[None, :, :] - self.pos[:, None, :]) * WORLD_SCALE
+        r2 = (d * d).sum(-1)
+        np.fill_diagonal(r2, np.inf)  # No self-interaction
+        r2[r2 == 0.0] = np.inf  # Coincident bodies exert no force
+        inv_r3 = r2**-1.5
+        # a_i = G * sum_j m_j * d_ij / |d_ij|^3 (direction comes from d itself)
+        return _G * (d * (self.mass[None, :, None] * inv_r3[:, :, None])).sum(axis=1)
+
+    def step(self, timestep: float) -> None:
+        """Advance every planet by one timestep.
+
+        Kick-drift-kick leapfrog: symplectic, so orbital energy stays
+        bounded over long runs and the fixed timestep can be much larger
+        than with the old Euler update. The closing half-kick acceleration
+        is reused as the next step's opening half-kick, keeping force
+        evaluations at one per step.
+        """
+        self.vel += self.acc * (0.5 * timestep)
+        self.pos += self.vel * (timestep / WORLD_SCALE)
+        self.acc = self._accelerations()
+        self.vel += self.acc * (0.5 * timestep)
+
+
+def world_to_screen_unchecked(world_x: float, world_y: float) -> tuple[float, float]:
+    """Convert world coordinates to screen coordinates, even offscreen ones."""
+    # Rebind the camera globals as locals: these functions run hundreds of
+    # times per frame and each LOAD_GLOBAL is a dict lookup
+    position = CURRENT_POSITION
+    zoom = CURRENT_ZOOM
+    return (
+        (world_x + position[0]) * zoom,
+        (world_y + position[1]) * zoom,
+    )
 
 
 def screen_to_world(screen_x: float, screen_y: float) -> tuple[float, float]:
     """Convert screen coordinates to world coordinates."""
-    return [
-        (screen_x / CURRENT_ZOOM) - CURRENT_POSITION[0],
-        (screen_y / CURRENT_ZOOM) - CURRENT_POSITION[1],
-    ]
+    position = CURRENT_POSITION
+    zoom = CURRENT_ZOOM
+    return (
+        (screen_x / zoom) - position[0],
+        (screen_y / zoom) - position[1],
+    )
 
 
 def size_to_screen(size: float) -> float:
@@ -108,16 +442,64 @@ def size_to_screen(size: float) -> float:
 
 def calculate_gravity(planet1: Planet, planet2: Planet) -> tuple[float, float]:
     """Calculate the gravitational force between two planets."""
-    dx = (planet2.position[0] - planet1.position[0]) * WORLD_SCALE
-    dy = (planet2.position[1] - planet1.position[1]) * WORLD_SCALE
-    distance = math.sqrt(dx**2 + dy**2)
-    if distance == 0:
+    world_scale = WORLD_SCALE
+    dx = (planet2.position[0] - planet1.position[0]) * world_scale
+    dy = (planet2.position[1] - planet1.position[1]) * world_scale
+    r2 = dx * dx + dy * dy
+    if r2 == 0:
         return 0, 0
-    force = _G * planet1.mass * planet2.mass / distance**2
-    angle = math.atan2(dy, dx)
-    force_x = force * math.cos(angle)
-    force_y = force * math.sin(angle)
-    return force_x, force_y
+    # F * (dx, dy) / r == G * m1 * m2 * (dx, dy) / r^3, no sqrt/atan2 needed
+    force = _G * planet1.mass * planet2.mass * r2**-1.5
+    return force * dx, force * dy
+
+
+def _planet_accelerations(planets: list[Planet]) -> list[list[float]]:
+    """Compute the gravitational acceleration on every planet.
+
+    Each pair is evaluated once and the force applied with opposite signs to
+    both bodies (Newton's third law), halving the number of force
+    calculations compared to updating every planet against every other.
+    """
+    count = len(planets)
+    acc = [[0.0, 0.0] for _ in range(count)]
+
+    for i in range(count):
+        planet1 = planets[i]
+        for j in range(i + 1, count):
+            planet2 = planets[j]
+            force_x, force_y = calculate_gravity(planet1, planet2)
+            acc[i][0] += force_x / planet1.mass
+            acc[i][1] += force_y / planet1.mass
+            acc[j][0] -= force_x / planet2.mass
+            acc[j][1] -= force_y / planet2.mass
+
+    return acc
+
+
+def step_planets(planets: list[Planet], timestep: float) -> None:
+    """Advance all planets by one timestep (pure-Python fallback path).
+
+    Same kick-drift-kick leapfrog as World.step: the closing half-kick
+    acceleration is cached on each planet and reused as the next step's
+    opening half-kick, so forces are only evaluated once per step.
+    """
+    world_scale = WORLD_SCALE
+    half_timestep = 0.5 * timestep
+
+    if any(planet.acceleration is None for planet in planets):
+        for planet, acc in zip(planets, _planet_accelerations(planets)):
+            planet.acceleration = acc
+
+    for planet in planets:
+        planet.velocity[0] += planet.acceleration[0] * half_timestep
+        planet.velocity[1] += planet.acceleration[1] * half_timestep
+        planet.position[0] += planet.velocity[0] * timestep / world_scale
+        planet.position[1] += planet.velocity[1] * timestep / world_scale
+
+    for planet, acc in zip(planets, _planet_accelerations(planets)):
+        planet.velocity[0] += acc[0] * half_timestep
+        planet.velocity[1] += acc[1] * half_timestep
+        planet.acceleration = acc
 
 
 def positions_to_angle(
@@ -129,6 +511,11 @@ def positions_to_angle(
     return math.atan2(dy, dx)
 
 
+# Last rendered grid surface and the view it was rendered for
+_grid_cache_key = None
+_grid_cache_surface = None
+
+
 def draw_grid(
     screen,
     top_left: tuple[float, float],
@@ -136,70 +523,143 @@ def draw_grid(
     spacing: int,
     color: tuple[int, int, int],
 ) -> None:
-    """Draw a grid on the screen."""
+    """Draw a grid on the screen.
+
+    The line pattern only depends on the zoom, the window size and the
+    camera offset modulo the spacing, so the rendered grid is cached as a
+    surface and re-blitted until the view actually changes; a still view
+    costs one blit per frame instead of hundreds of draw.line calls.
+    """
+    global _grid_cache_key, _grid_cache_surface
+    cache_key = (
+        round(CURRENT_ZOOM, 6),
+        tuple(WINDOW_SIZE),
+        round((CURRENT_POSITION[0] % spacing) * CURRENT_ZOOM, 3),
+        round((CURRENT_POSITION[1] % spacing) * CURRENT_ZOOM, 3),
+        spacing,
+        color,
+    )
+    if cache_key == _grid_cache_key:
+        screen.blit(_grid_cache_surface, (0, 0))
+        return
+
+    grid_surface = pygame.Surface(WINDOW_SIZE, pygame.SRCALPHA)
+
     # Snap grid lines to the nearest spacing interval
     start_x = (top_left[0] // spacing) * spacing
     end_x = (bottom_right[0] // spacing + 1) * spacing
     start_y = (top_left[1] // spacing) * spacing
     end_y = (bottom_right[1] // spacing + 1) * spacing
 
-    # Draw vertical grid lines
-    for x in range(int(start_x), int(end_x), spacing):
-        screen_x, _ = world_to_screen(x, 0, allow_offscreen=True)
-        if 0 <= screen_x <= WINDOW_SIZE[0]:  # Only draw if on screen
-            pygame.draw.line(screen, color, (screen_x, 0), (screen_x, WINDOW_SIZE[1]))
+    if np is not None:
+        # One affine transform over all candidate lines, then keep the
+        # on-screen ones with a boolean mask
+        xs = (
+            np.arange(int(start_x), int(end_x), spacing, dtype=np.float64)
+            + CURRENT_POSITION[0]
+        ) * CURRENT_ZOOM
+        ys = (
+            np.arange(int(start_y), int(end_y), spacing, dtype=np.float64)
+            + CURRENT_POSITION[1]
+        ) * CURRENT_ZOOM
+        xs = xs[(xs >= 0) & (xs <= WINDOW_SIZE[0])]
+        ys = ys[(ys >= 0) & (ys <= WINDOW_SIZE[1])]
+    else:
+        xs = [
+            screen_x
+            for x in range(int(start_x), int(end_x), spacing)
+            if 0 <= (screen_x := (x + CURRENT_POSITION[0]) * CURRENT_ZOOM) <= WINDOW_SIZE[0]
+        ]
+        ys = [
+            screen_y
+            for y in range(int(start_y), int(end_y), spacing)
+            if 0 <= (screen_y := (y + CURRENT_POSITION[1]) * CURRENT_ZOOM) <= WINDOW_SIZE[1]
+        ]
+
+    # Draw vertical then horizontal grid lines
+    for screen_x in xs:
+        pygame.draw.line(
+            grid_surface, color, (screen_x, 0), (screen_x, WINDOW_SIZE[1])
+        )
+    for screen_y in ys:
+        pygame.draw.line(
+            grid_surface, color, (0, screen_y), (WINDOW_SIZE[0], screen_y)
+        )
 
-    # Draw horizontal grid lines
-    for y in range(int(start_y), int(end_y), spacing):
-        _, screen_y = world_to_screen(0, y, allow_offscreen=True)
-        if 0 <= screen_y <= WINDOW_SIZE[1]:  # Only draw if on screen
-            pygame.draw.line(screen, color, (0, screen_y), (WINDOW_SIZE[0], screen_y))
+    _grid_cache_key = cache_key
+    _grid_cache_surface = grid_surface
+    screen.blit(grid_surface, (0, 0))
 
 
 def center_on_screen(position: tuple[float, float]) -> tuple[float, float]:
     """Center the view on the given position."""
-    screen_pos = world_to_screen(position[0], position[1], True)
+    screen_pos = world_to_screen_unchecked(position[0], position[1])
     centered_inverted = screen_to_world(
         screen_pos[0] - WINDOW_SIZE[0] / 2, screen_pos[1] - WINDOW_SIZE[1] / 2
     )
-    return [-centered_inverted[0], -centered_inverted[1]]
-
-
-def is_on_screen(world_pos: tuple[float, float]) -> bool:
-    """Check if a world position is on the screen."""
-    screen_pos = world_to_screen(world_pos[0], world_pos[1], False)
-    return screen_pos[0] is not None
+    return (-centered_inverted[0], -centered_inverted[1])
 
 
 def draw_info(
-    screen: pygame.surface.Surface, font: pygame.font.Font, planet: Planet
+    screen: pygame.surface.Surface,
+    font: pygame.font.Font,
+    planet: Planet,
+    screen_pos: tuple[float, float],
+    refresh: bool = False,
 ) -> None:
-    """Draw the planet information on the screen."""
-    x, y = world_to_screen(planet.position[0], planet.position[1])
-    name_text = font.render(f"Name: {planet.name}", font, WHITE)
-    position_text = font.render(
-        f"Pos: ({round(planet.position[0])}, {round(planet.position[1])})", font, WHITE
-    )
-    velocity_text = font.render(
-        f"Vel: {round(math.hypot(planet.velocity[0], planet.velocity[1]) * 0.001, 2)} km/s",
-        font,
-        WHITE,
-    )
+    """Draw the planet information on the screen.
+
+    The name label is rendered once per planet; the position/velocity text
+    is only re-rendered when `refresh` is set (at GUI_UPDATE_RATE), since
+    font.render is too slow to run per frame for slowly-changing text.
+    """
+    x, y = screen_pos
+    name_text = planet.ensure_label(font)
+    if refresh or planet._info_surfaces is None:
+        position_text = font.render(
+            f"Pos: ({round(planet.position[0])}, {round(planet.position[1])})",
+            True,
+            WHITE,
+        )
+        velocity_text = font.render(
+            f"Vel: {round(math.hypot(planet.velocity[0], planet.velocity[1]) * 0.001, 2)} km/s",
+            True,
+            WHITE,
+        )
+        planet._info_surfaces = (position_text, velocity_text)
+    position_text, velocity_text = planet._info_surfaces
     screen.blit(name_text, (x + 20, y + 20))
     screen.blit(position_text, (x + 20, y + 50))
     screen.blit(velocity_text, (x + 20, y + 80))
 
 
-def is_hovering(position: tuple[float, float], planet: Planet) -> bool:
+def is_hovering(
+    position: tuple[float, float],
+    screen_pos: tuple[float, float],
+    radius_px: float,
+) -> bool:
     """Check if the mouse is hovering over a planet."""
-    x, y = world_to_screen(planet.position[0], planet.position[1])
-    return x is not None and math.hypot(x - position[0], y - position[1]) <= max(
-        size_to_screen(planet.radius), 5
-    )
+    dx = screen_pos[0] - position[0]
+    dy = screen_pos[1] - position[1]
+    # Compare squared distances to skip the square root
+    return dx * dx + dy * dy <= radius_px * radius_px
+
 
+@functools.lru_cache(maxsize=256)
+def render_text(text: str) -> pygame.surface.Surface:
+    """Render a white text surface, cached by string.
 
+    font.render rasterizes glyphs and allocates a surface on every call;
+    text that repeats between frames (an idle mouse readout, stable GUI
+    labels) comes straight from the cache instead.
+    """
+    return font.render(text, True, WHITE)
+
+
+@functools.lru_cache(maxsize=64)
 def seconds_to_time(seconds: int) -> tuple[int, int, int, int, int, int]:
     """Convert seconds to a human-readable time format."""
+    seconds = int(seconds)  # Integer divmod is faster and renders without .0
     minutes, seconds = divmod(seconds, 60)
     hours, minutes = divmod(minutes, 60)
     days, hours = divmod(hours, 24)
@@ -303,6 +763,7 @@ if __name__ == "__main__":
             color=(75, 111, 154),  # Darker blue
         ),  # Neptune
     ]
+    world = World.from_planets(planets) if np is not None else None
     pygame.init()
 
     screen = pygame.display.set_mode(WINDOW_SIZE, RESIZABLE)
@@ -320,11 +781,13 @@ if __name__ == "__main__":
 
     followed_planet = None
     hovered_planets = []
+    screen_positions = []
 
     while running:
-        # Accumulate time passed
-        time_passed += timestep
-        physics_counter += timestep
+        # Accumulate time passed (no simulation time flows while paused)
+        if not paused:
+            time_passed += timestep
+            physics_counter += timestep
 
         mouse_x, mouse_y = pygame.mouse.get_pos()
 
@@ -339,12 +802,10 @@ if __name__ == "__main__":
                 elif event.key == pygame.K_w:
                     timestep *= 2
                 elif event.key == pygame.K_s:
-                    timestep /= 2
+                    timestep = max(1, timestep // 2)  # Keep the timestep integral
                 elif event.key == pygame.K_c:
-                    CURRENT_POSITION = [
-                        WINDOW_SIZE[0] * WORLD_SCALE / 20000,
-                        WINDOW_SIZE[1] * WORLD_SCALE / 20000,
-                    ]
+                    CURRENT_POSITION[0] = WINDOW_SIZE[0] * WORLD_SCALE / 20000
+                    CURRENT_POSITION[1] = WINDOW_SIZE[1] * WORLD_SCALE / 20000
                     CURRENT_ZOOM = 0.001
             elif event.type == MOUSEWHEEL:
                 # Nonlinear zoom
@@ -376,22 +837,10 @@ if __name__ == "__main__":
                     CURRENT_POSITION[1] += event.rel[1] / CURRENT_ZOOM
                     # Stop following a planet when dragging
                     followed_planet = None
-
-                hovered_planets = []
-                for planet in planets:
-                    x, y = world_to_screen(planet.position[0], planet.position[1])
-                    if x is not None and is_hovering((mouse_x, mouse_y), planet):
-                        is_planet_hovered = True
-                        hovered_planets.append(planet)
-
             elif event.type == pygame.MOUSEBUTTONUP:
                 # Follow a planet when clicking on it
                 if event.button == 1:
-                    followed_planet = None
-                    for planet in planets:
-                        x, y = world_to_screen(planet.position[0], planet.position[1])
-                        if x is not None and is_hovering((mouse_x, mouse_y), planet):
-                            followed_planet = planet
+                    followed_planet = hovered_planets[-1][0] if hovered_planets else None
             elif event.type == VIDEORESIZE:
                 # Adjust CURRENT_POSITION to maintain the same relative position
                 CURRENT_POSITION[0] *= event.w / WINDOW_SIZE[0]
@@ -407,14 +856,37 @@ if __name__ == "__main__":
 
         # Update the planets based on the fixed timestep
         while physics_counter >= FIXED_TIMESTEP:
-            if not paused:
-                for planet in planets:
-                    planet.update(planets, FIXED_TIMESTEP)
+            if world is not None:
+                world.step(FIXED_TIMESTEP)
+            else:
+                step_planets(planets, FIXED_TIMESTEP)
             physics_counter -= FIXED_TIMESTEP
 
         # Center the view on the followed planet
         if followed_planet:
-            CURRENT_POSITION = center_on_screen(followed_planet.position)
+            CURRENT_POSITION[0], CURRENT_POSITION[1] = center_on_screen(
+                followed_planet.position
+            )
+
+        # Cache each planet's screen position once per frame; drawing, hover
+        # checks, the info boxes and the ESP lines all reuse it
+        screen_positions = [
+            world_to_screen_unchecked(planet.position[0], planet.position[1])
+            for planet in planets
+        ]
+        on_screen = [
+            0 <= x <= WINDOW_SIZE[0] and 0 <= y <= WINDOW_SIZE[1]
+            for x, y in screen_positions
+        ]
+
+        hovered_planets.clear()  # Reuse the list instead of reallocating
+        followed_screen_pos = None
+        for planet, screen_pos, visible in zip(planets, screen_positions, on_screen):
+            if planet is followed_planet:
+                followed_screen_pos = screen_pos
+            radius_px = max(size_to_screen(planet.radius), 5)
+            if visible and is_hovering((mouse_x, mouse_y), screen_pos, radius_px):
+                hovered_planets.append((planet, screen_pos))
 
         # Draw the grid
         screen_top_left = screen_to_world(0, 0)
@@ -425,11 +897,12 @@ if __name__ == "__main__":
 
         SCREEN_CENTER = screen_to_world(WINDOW_SIZE[0] / 2, WINDOW_SIZE[1] / 2)
 
-        # Draw the planets
-        for planet in planets:
-            planet.draw(screen)
-            # Render planet ESP if not on screen
-            if not is_on_screen(planet.position):
+        # Draw the planets: the visible ones as circles, the offscreen ones
+        # as ESP direction lines
+        for planet, screen_pos, visible in zip(planets, screen_positions, on_screen):
+            if visible:
+                planet.draw(screen, screen_pos)
+            else:
                 angle = positions_to_angle(SCREEN_CENTER, planet.position)
                 direction_vector = (math.cos(angle), math.sin(angle))
                 line_length = (
@@ -459,46 +932,47 @@ if __name__ == "__main__":
                     2,
                 )
 
+        gui_counter += 1
+        gui_refresh = gui_counter >= GUI_UPDATE_RATE
+
         if followed_planet:
-            draw_info(screen, font, followed_planet)
-            if followed_planet in hovered_planets:
-                hovered_planets.remove(followed_planet)
+            draw_info(
+                screen, font, followed_planet, followed_screen_pos, gui_refresh
+            )
 
         # Draw the hovered planet information
-        for planet in hovered_planets:
-            draw_info(screen, font, planet)
+        for planet, screen_pos in hovered_planets:
+            if planet is not followed_planet:
+                draw_info(screen, font, planet, screen_pos, gui_refresh)
 
         # Draw the mouse coordinates and scale at full framerate
         world_mouse_x, world_mouse_y = screen_to_world(mouse_x, mouse_y)
-        coordinates_text = font.render(
+        coordinates_text = render_text(
             f"({round(world_mouse_x / 1000, 2)}k, {round(world_mouse_y / 1000, 2)}k) - "
             f"({round(CURRENT_POSITION[0] / 1000, 2)}k, {round(CURRENT_POSITION[1] / 1000, 2)}k) - "
-            f"{round(CURRENT_ZOOM, 4)} ",
-            font,
-            WHITE,
+            f"{round(CURRENT_ZOOM, 4)} "
         )
         screen.blit(coordinates_text, (5, 5))
 
-        gui_counter += 1
         # Update the GUI every GUI_UPDATE_RATE frames
-        if gui_counter >= GUI_UPDATE_RATE:
+        if gui_refresh:
             gui_text = []
             gui_counter = 0
 
             # Draw the current timestep
             timestep_text = font.render(
-                f"Timestep: {format_time(*seconds_to_time(timestep))}", font, WHITE
+                f"Timestep: {format_time(*seconds_to_time(timestep))}", True, WHITE
             )
             gui_text.append((timestep_text, (5, 35)))
 
             # Draw the current FPS
-            fps_text = font.render(f"{round(clock.get_fps())} FPS", font, WHITE)
+            fps_text = font.render(f"{round(clock.get_fps())} FPS", True, WHITE)
             gui_text.append((fps_text, (5, 65)))
 
             # Draw the time passed
             time_passed_text = font.render(
                 f"Time passed: {format_time(*seconds_to_time(time_passed))}",
-                font,
+                True,
                 WHITE,
             )
             gui_text.append(